@@ -1,12 +1,22 @@
+import html
+import json
+import random
 import re
+import time
+import uuid
 from datetime import datetime
+from pathlib import Path
 from urllib.parse import quote_plus
 
 import gspread
 import pandas as pd
 import streamlit as st
+from google.auth.transport.requests import AuthorizedSession
 from google.oauth2.service_account import Credentials
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
+from googleapiclient.http import build_http
 
 # Scopes required for Google Sheets access
 SCOPES = [
@@ -21,6 +31,7 @@ class FIELDS:
     Class to hold field names for the Google Sheets data.
     """
 
+    TIMESTAMP = 'Timestamp'
     EVENT_NAME = 'Event Name'
     DESCRIPTION = 'Description'
     EVENT_DATE = 'Event Date'
@@ -60,6 +71,44 @@ OPTIONAL_FIELDS = [
     FIELDS.END_REPEAT_DATE,
 ]
 
+# Columns that must be present in the sheet
+ALL_FIELDS = frozenset(REQUIRED_FIELDS) | frozenset(OPTIONAL_FIELDS)
+
+# Columns kept when loading submissions
+LOADED_FIELDS = ALL_FIELDS | {FIELDS.TIMESTAMP, FIELDS.PHONE, FIELDS.STATUS}
+
+# Columns renamed for display when loading submissions, so the cached DataFrame is ready to
+# render on every rerun
+DISPLAY_NAMES = {FIELDS.TIMESTAMP: 'Submission Time'}
+
+# Columns parsed into dates and times when loading submissions
+DATE_FIELDS = [FIELDS.EVENT_DATE, FIELDS.END_DATE, FIELDS.END_REPEAT_DATE]
+TIME_FIELDS = [FIELDS.START_TIME, FIELDS.END_TIME]
+
+# Submissions with these statuses have been processed and are hidden from review
+HIDDEN_STATUSES = frozenset({'Ignored', 'Added to Calendar'})
+
+# Accepted email address format, compiled once since validation runs on every rerun
+EMAIL_PATTERN = re.compile(r'^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,6}\Z', re.ASCII)
+
+# Worksheets fetched together when loading the spreadsheet
+WORKSHEETS = ['Form Responses 1', 'Authorized Users']
+
+# HTML template for the calendar event description
+DESCRIPTION_TEMPLATE = (
+    '<p>{description}</p>'
+    '<p><strong>Submitter:</strong> {org_name}<br>'
+    '<strong>Event Type:</strong> {event_type}<br>'
+    '<strong>Fee:</strong> {fee}<br>'
+    '<strong>Email:</strong> {email}</p>'
+)
+
+# Directory for the on-disk copy of the sheet values, reused while the sheet is unmodified
+SHEET_CACHE_DIR = Path(__file__).with_name('.cache')
+
+# Number of times to retry Google API requests that fail with a rate limit or server error
+NUM_RETRIES = 4
+
 FREQUENCY_OPTIONS = {
     'Daily': 'DAILY',
     'Weekly': 'WEEKLY',
@@ -70,25 +119,100 @@ FREQUENCY_OPTIONS = {
 
 
 @st.cache_resource
-def get_google_sheets_client() -> gspread.Client:
+def get_credentials() -> Credentials:
     """
-    Create and cache a Google Sheets client using service account credentials.
+    Create and cache the service account credentials.
+
+    Credentials are thread-safe and refresh their own token, so every session and transport
+    shares this one object and the secrets are read only once.
 
     Returns
     -------
-    gspread.Client
-        An authorized gspread client for Google Sheets access.
+    google.oauth2.service_account.Credentials
+        Service account credentials scoped for Google API access.
     """
     try:
         # Get service account info from secrets
         service_account_info = st.secrets['gcp_service_account']
 
         # Create credentials from the service account info
-        credentials = Credentials.from_service_account_info(service_account_info, scopes=SCOPES)
+        return Credentials.from_service_account_info(service_account_info, scopes=SCOPES)
+
+    except Exception as e:
+        st.error('Failed to authenticate with Google:')
+        st.exception(e)
+        st.stop()
+
+
+@st.cache_resource
+def get_authorized_session() -> AuthorizedSession:
+    """
+    Create and cache an authorized HTTP session using service account credentials.
+
+    The session pools connections, so every Google Sheets request reuses the same TLS
+    connection instead of opening a new one.
+
+    Returns
+    -------
+    google.auth.transport.requests.AuthorizedSession
+        An authorized requests session for Google API access.
+    """
+    return AuthorizedSession(get_credentials())
+
+
+@st.cache_resource
+def get_authorized_http() -> AuthorizedHttp:
+    """
+    Create and cache an authorized httplib2 transport for the Google API client.
 
-        # Create and return the gspread client
-        client = gspread.authorize(credentials)
-        return client
+    Drive and Calendar are served from the same host, so sharing one transport lets them
+    reuse a connection.
+
+    Returns
+    -------
+    google_auth_httplib2.AuthorizedHttp
+        An authorized HTTP transport for googleapiclient resources.
+    """
+    return AuthorizedHttp(get_credentials(), http=build_http())
+
+
+class RetryingHTTPClient(gspread.HTTPClient):
+    """
+    gspread HTTP client that retries rate-limited and transient server errors with
+    exponential backoff, instead of failing the whole page.
+    """
+
+    RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+    def request(self, *args, **kwargs):
+        for attempt in range(NUM_RETRIES + 1):
+            try:
+                return super().request(*args, **kwargs)
+            except gspread.exceptions.APIError as e:
+                # Use the HTTP status, since e.code is -1 when the error body isn't JSON, as
+                # with the HTML pages returned for gateway errors
+                status_code = e.response.status_code
+                if status_code not in self.RETRY_STATUS_CODES or attempt == NUM_RETRIES:
+                    raise
+                time.sleep(0.5 * 2**attempt + random.random() * 0.1)
+
+
+@st.cache_resource
+def get_google_sheets_client() -> gspread.Client:
+    """
+    Create and cache a Google Sheets client using the shared authorized session.
+
+    Returns
+    -------
+    gspread.Client
+        An authorized gspread client for Google Sheets access.
+    """
+    try:
+        return gspread.Client(
+            auth=get_credentials(),
+            session=get_authorized_session(),
+            http_client=RetryingHTTPClient,
+        )
 
     except Exception as e:
         st.error('Failed to authenticate with Google Sheets:')
@@ -96,6 +220,153 @@ def get_google_sheets_client() -> gspread.Client:
         st.stop()
 
 
+@st.cache_resource
+def get_spreadsheet(spreadsheet_id: str) -> gspread.Spreadsheet:
+    """
+    Open and cache a Google Spreadsheet, so its metadata is only fetched once.
+
+    Parameters
+    ----------
+    spreadsheet_id : str
+        The ID of the Google Spreadsheet.
+
+    Returns
+    -------
+    gspread.Spreadsheet
+        The opened spreadsheet.
+    """
+    return get_google_sheets_client().open_by_key(spreadsheet_id)
+
+
+@st.cache_resource
+def get_worksheet(spreadsheet_id: str, worksheet_name: str) -> gspread.Worksheet:
+    """
+    Get and cache a worksheet of a Google Spreadsheet.
+
+    Parameters
+    ----------
+    spreadsheet_id : str
+        The ID of the Google Spreadsheet.
+    worksheet_name : str
+        Name of the worksheet.
+
+    Returns
+    -------
+    gspread.Worksheet
+        The worksheet.
+    """
+    return get_spreadsheet(spreadsheet_id).worksheet(worksheet_name)
+
+
+@st.cache_data(ttl=300, max_entries=8, show_spinner=False)  # Cache for 5 minutes
+def get_sheet_values(spreadsheet_id: str) -> dict:
+    """
+    Fetch the values of all worksheets used by the app in a single request.
+
+    Parameters
+    ----------
+    spreadsheet_id : str
+        The ID of the Google Spreadsheet.
+
+    Returns
+    -------
+    dict
+        Mapping of worksheet name to its rows, each a list of cell values. Trailing empty
+        cells are omitted by the API, so rows may have different lengths.
+    """
+    # Reuse the copy on disk if the spreadsheet hasn't been modified since it was saved
+    cache_path = SHEET_CACHE_DIR / f'{spreadsheet_id}.json'
+    modified_time = get_modified_time(spreadsheet_id)
+    if modified_time is not None:
+        try:
+            cached = json.loads(cache_path.read_text())
+            if cached['modified_time'] == modified_time:
+                return cached['values']
+        except (OSError, ValueError, KeyError):
+            pass  # no usable copy on disk
+
+    try:
+        # Fetch every worksheet with one batchGet instead of one request per worksheet. Call it
+        # by ID, since opening the spreadsheet would first fetch its metadata in another request
+        http_client = get_google_sheets_client().http_client
+        response = http_client.values_batch_get(
+            spreadsheet_id, [f"'{name}'" for name in WORKSHEETS]
+        )
+        values = {
+            name: value_range.get('values', [])
+            for name, value_range in zip(WORKSHEETS, response['valueRanges'])
+        }
+
+    except Exception as e:
+        if isinstance(e, gspread.exceptions.APIError) and e.code == 404:
+            st.error('Spreadsheet not found. Please check the spreadsheet ID.')
+        else:
+            st.error(
+                'Error loading spreadsheet data. Check that the spreadsheet is shared with the '
+                'service account, that the service account project has the Google Sheets API '
+                'enabled, and that the spreadsheet has the worksheets '
+                f'{", ".join(map(repr, WORKSHEETS))}.'
+            )
+            st.exception(e)
+        st.stop()
+
+    # Save a copy on disk. The modified time was read before fetching, so if the sheet
+    # changed in between, the copy is just treated as outdated next time
+    if modified_time is not None:
+        try:
+            SHEET_CACHE_DIR.mkdir(exist_ok=True)
+            cache_path.write_text(json.dumps({'modified_time': modified_time, 'values': values}))
+        except OSError:
+            pass  # the copy on disk is only an optimization
+    return values
+
+
+def get_modified_time(spreadsheet_id: str) -> str | None:
+    """
+    Get the time a spreadsheet was last modified from Google Drive.
+
+    Parameters
+    ----------
+    spreadsheet_id : str
+        The ID of the Google Spreadsheet.
+
+    Returns
+    -------
+    str | None
+        The RFC 3339 modified time, or None if it cannot be retrieved.
+    """
+    try:
+        # Build the resource without get_google_api_resource, which stops the app on failure
+        request = (
+            build_google_api_resource('drive')
+            .files()
+            .get(fileId=spreadsheet_id, fields='modifiedTime')
+        )
+        return request.execute(num_retries=NUM_RETRIES)['modifiedTime']
+    except Exception:
+        return None
+
+
+def clear_sheet_values(spreadsheet_id: str):
+    """
+    Clear the cached sheet values, both in memory and on disk.
+
+    The copy on disk is removed as well, since Drive may not report the new modified time
+    right after a write.
+
+    Parameters
+    ----------
+    spreadsheet_id : str
+        The ID of the Google Spreadsheet.
+
+    Returns
+    -------
+    None
+    """
+    get_sheet_values.clear()
+    (SHEET_CACHE_DIR / f'{spreadsheet_id}.json').unlink(missing_ok=True)
+
+
 def ensure_status_columns(spreadsheet_id, worksheet_name='Form Responses 1'):
     """
     Check if Status and Last Updated By columns exist, add them if they don't.
@@ -112,25 +383,55 @@ def ensure_status_columns(spreadsheet_id, worksheet_name='Form Responses 1'):
     None
         Adds columns if missing; reruns Streamlit app if changes are made.
     """
-    client = get_google_sheets_client()
-    spreadsheet = client.open_by_key(spreadsheet_id)
-    worksheet = spreadsheet.worksheet(worksheet_name)
-
     # Get the header row
-    headers = worksheet.row_values(1)
+    rows = get_sheet_values(spreadsheet_id)[worksheet_name]
+    headers = rows[0] if len(rows) > 0 else []
 
     # Add any missing required columns
     missing_cols = [col for col in [FIELDS.STATUS, FIELDS.LAST_UPDATED_BY] if col not in headers]
     if len(missing_cols) == 0:
         return
-    for col_idx, col in enumerate(missing_cols, start=1 + len(headers)):
-        worksheet.update_cell(1, col_idx, col)
-        st.success(f"Added '{col}' column to the spreadsheet")
-    st.cache_data.clear()  # Clear cache to reflect changes
+
+    # Make room for the new columns, since writing outside the grid fails
+    worksheet = get_worksheet(spreadsheet_id, worksheet_name)
+    last_col = len(headers) + len(missing_cols)
+    if worksheet.col_count < last_col:
+        worksheet.add_cols(last_col - worksheet.col_count)
+
+    # Write all missing headers in a single request
+    first_cell = gspread.utils.rowcol_to_a1(1, len(headers) + 1)
+    last_cell = gspread.utils.rowcol_to_a1(1, last_col)
+    worksheet.update(range_name=f'{first_cell}:{last_cell}', values=[missing_cols])
+    st.success(f'Added {", ".join(repr(col) for col in missing_cols)} to the spreadsheet')
+
+    # Clear only the caches that depend on the responses worksheet
+    clear_sheet_values(spreadsheet_id)
+    load_spreadsheet_data.clear()
     st.rerun()  # Rerun to reflect changes immediately
 
 
-@st.cache_data(ttl=300, show_spinner=False)  # Cache for 5 minutes
+def get_header_columns(spreadsheet_id: str, worksheet_name: str = 'Form Responses 1') -> dict:
+    """
+    Get the column number of each header in the worksheet.
+
+    Parameters
+    ----------
+    spreadsheet_id : str
+        The ID of the Google Spreadsheet.
+    worksheet_name : str, optional
+        Name of the worksheet (default is 'Form Responses 1').
+
+    Returns
+    -------
+    dict
+        Mapping of header name to 1-based column number.
+    """
+    rows = get_sheet_values(spreadsheet_id)[worksheet_name]
+    headers = rows[0] if len(rows) > 0 else []
+    return {header: col_idx for col_idx, header in enumerate(headers, start=1)}
+
+
+@st.cache_data(ttl=300, max_entries=8, show_spinner=False)  # Cache for 5 minutes
 def load_spreadsheet_data(spreadsheet_id, worksheet_name='Form Responses 1') -> pd.DataFrame:
     """
     Load data from a Google Spreadsheet, filtering out ignored/completed items.
@@ -145,43 +446,82 @@ def load_spreadsheet_data(spreadsheet_id, worksheet_name='Form Responses 1') ->
     Returns
     -------
     pandas.DataFrame
-        The spreadsheet data as a DataFrame, filtered for display.
+        The spreadsheet data as a DataFrame, filtered for display and indexed by sheet row number.
     """
-    try:
-        # Get the Google Sheets client
-        client = get_google_sheets_client()
+    rows = get_sheet_values(spreadsheet_id)[worksheet_name]
+    if len(rows) == 0:
+        return pd.DataFrame()
+    headers, data_rows = rows[0], rows[1:]
+
+    # Build the DataFrame from the 2D list directly, keeping only the needed columns and
+    # filling in the trailing empty cells the API omits. Arrow-backed strings take less memory
+    # than Python objects and let the status filter run as a vectorized kernel
+    keep = [col_idx for col_idx, header in enumerate(headers) if header in LOADED_FIELDS]
+    df = pd.DataFrame(data_rows).reindex(columns=keep).fillna('').astype('string[pyarrow]')
+    df.columns = [DISPLAY_NAMES.get(headers[col_idx], headers[col_idx]) for col_idx in keep]
+
+    # Index by sheet row number (the header is row 1), so updates go straight to the right row
+    df.index = pd.RangeIndex(2, len(df) + 2)
+
+    if not df.empty:
+        # Filter out ignored and completed submissions, and the Status column itself
+        pending = ~df[FIELDS.STATUS].isin(HIDDEN_STATUSES).to_numpy()
+        df = df.loc[pending, df.columns != FIELDS.STATUS]
+
+        # Parse dates and times for the whole column at once, rather than per selected row
+        df = df.assign(
+            **{field: parse_date_column(df[field]) for field in DATE_FIELDS if field in df},
+            **{field: parse_time_column(df[field]) for field in TIME_FIELDS if field in df},
+        )
 
-        # Open the spreadsheet by ID
-        spreadsheet = client.open_by_key(spreadsheet_id)
+    return df
 
-        # Get the specified worksheet
-        worksheet = spreadsheet.worksheet(worksheet_name)
 
-        # Load all records into a DataFrame
-        df = pd.DataFrame(worksheet.get_all_records())
+def parse_date_column(values: pd.Series) -> pd.Series:
+    """
+    Parse a column of MM/DD/YYYY date strings.
 
-        if not df.empty:
-            # Filter out ignored and completed submissions
-            df = df[~df['Status'].isin(['Ignored', 'Added to Calendar'])]
+    Parameters
+    ----------
+    values : pandas.Series
+        Date strings as formatted in the spreadsheet.
 
-            # Filter out columns that are not needed for display
-            df = df.drop(columns=[FIELDS.STATUS, FIELDS.LAST_UPDATED_BY], errors='ignore')
+    Returns
+    -------
+    pandas.Series
+        Column of datetime.date objects, with None for empty or invalid values.
+    """
+    dates = pd.to_datetime(values, format='%m/%d/%Y', errors='coerce', cache=True)
+    return dates.dt.date.astype(object).where(dates.notna(), None)
 
-        return df
 
-    except gspread.SpreadsheetNotFound:
-        st.error('Spreadsheet not found. Please check the spreadsheet ID.')
-        st.stop()
-    except gspread.WorksheetNotFound:
-        st.error(f"Worksheet '{worksheet_name}' not found in the spreadsheet.")
-        st.stop()
-    except Exception as e:
-        st.error('Error loading spreadsheet data:')
-        st.exception(e)
-        st.stop()
+def parse_time_column(values: pd.Series) -> pd.Series:
+    """
+    Parse a column of time strings, e.g. '10:00:00 AM'.
+
+    Parameters
+    ----------
+    values : pandas.Series
+        Time strings as formatted in the spreadsheet.
+
+    Returns
+    -------
+    pandas.Series
+        Column of datetime.time objects, with None for empty or invalid values.
+    """
+    times = pd.to_datetime(values, format='%I:%M:%S %p', errors='coerce', cache=True)
+
+    # Fall back to inferring the format for any values that don't match the form's format
+    fallback = times.isna() & (values != '')
+    if fallback.any():
+        times[fallback] = pd.to_datetime(values[fallback], format='mixed', errors='coerce')
+    return times.dt.time.astype(object).where(times.notna(), None)
 
 
-@st.cache_data(ttl=300)  # Cache for 5 minutes
+# The user list rarely changes, so cache it for an hour. It is not persisted, since persisted
+# caches ignore the TTL and a removed user must lose access. Cold starts already reuse the
+# sheet values saved on disk, and "Refresh Users" picks up changes right away
+@st.cache_data(ttl=3600, max_entries=4, show_spinner=False)  # Cache for 1 hour
 def get_authorized_users(spreadsheet_id: str) -> set:
     """
     Get the authorized users from the spreadsheet.
@@ -196,31 +536,21 @@ def get_authorized_users(spreadsheet_id: str) -> set:
     set
         Set of authorized user email addresses.
     """
-    worksheet_name = 'Authorized Users'
-    try:
-        client = get_google_sheets_client()
-        spreadsheet = client.open_by_key(spreadsheet_id)
-        worksheet = spreadsheet.worksheet(worksheet_name)
-
-        # Get all records
-        records = worksheet.get_all_records()
+    rows = get_sheet_values(spreadsheet_id)['Authorized Users']
+    if len(rows) == 0 or 'Email' not in rows[0]:
+        return set()
 
-        # Extract unique usernames from 'Email' column
-        usernames = set(record.get('Email') for record in records)
-
-        return usernames
-
-    except Exception as e:
-        st.error(
-            'Error retrieving authorized users. Check that the spreadsheet is shared with the '
-            'service account, and that the service account project has the Google Sheets API enabled.'
-        )
-        st.exception(e)
-        st.stop()
+    # Extract unique usernames from 'Email' column
+    email_idx = rows[0].index('Email')
+    return set(row[email_idx] for row in rows[1:] if len(row) > email_idx)
 
 
 def update_submission_status(
-    spreadsheet_id: str, row_idx: int, status: str, worksheet_name: str = 'Form Responses 1'
+    spreadsheet_id: str,
+    sheet_row: int,
+    status: str,
+    updated_by: str,
+    worksheet_name: str = 'Form Responses 1',
 ) -> bool:
     """
     Update the status of a submission in the spreadsheet.
@@ -229,10 +559,12 @@ def update_submission_status(
     ----------
     spreadsheet_id : str
         The ID of the Google Spreadsheet.
-    row_idx : int
-        Row index in the original sheet (0-indexed, not counting header).
+    sheet_row : int
+        Row number of the submission in the sheet (1-based, the header is row 1).
     status : str
         New status to set.
+    updated_by : str
+        Name of the user making the update, recorded in the Last Updated By column.
     worksheet_name : str, optional
         Name of the worksheet (default is 'Form Responses 1').
 
@@ -242,24 +574,27 @@ def update_submission_status(
         Success status.
     """
     try:
-        client = get_google_sheets_client()
-        spreadsheet = client.open_by_key(spreadsheet_id)
-        worksheet = spreadsheet.worksheet(worksheet_name)
-
-        # Get headers to find Status column
-        headers = worksheet.row_values(1)
-        status_col = headers.index('Status') + 1
-        last_updated_col = headers.index('Last Updated By') + 1
-
-        # Update status
-        row_num = row_idx + 2  # Convert to 1-based index for Google Sheets
-        worksheet.update_cell(row_num, status_col, status)
-
-        # Update last updated by
-        worksheet.update_cell(row_num, last_updated_col, st.user.name)  # type: ignore
+        worksheet = get_worksheet(spreadsheet_id, worksheet_name)
+
+        # Look up the Status and Last Updated By columns
+        header_columns = get_header_columns(spreadsheet_id, worksheet_name)
+        status_col = header_columns[FIELDS.STATUS]
+        last_updated_col = header_columns[FIELDS.LAST_UPDATED_BY]
+
+        # Update status and last updated by in a single request
+        worksheet.batch_update(
+            [
+                {'range': gspread.utils.rowcol_to_a1(sheet_row, status_col), 'values': [[status]]},
+                {
+                    'range': gspread.utils.rowcol_to_a1(sheet_row, last_updated_col),
+                    'values': [[updated_by]],
+                },
+            ]
+        )
 
-        # Clear cache to reflect changes
-        st.cache_data.clear()
+        # Clear cached submissions to reflect changes
+        clear_sheet_values(spreadsheet_id)
+        load_spreadsheet_data.clear()
         return True
 
     except Exception as e:
@@ -269,9 +604,36 @@ def update_submission_status(
 
 
 @st.cache_resource
+def build_google_api_resource(api_name: str):
+    """
+    Build and cache a Google API service resource using the shared authorized transport.
+
+    Errors are raised to the caller; use get_google_api_resource to report them instead.
+
+    Parameters
+    ----------
+    api_name : str
+        The name of the Google API (e.g., 'drive', 'calendar').
+
+    Returns
+    -------
+    googleapiclient.discovery.Resource
+        An authorized Google API service resource.
+    """
+    # Use the discovery documents bundled with the client library, skipping the
+    # discovery cache lookup and any HTTP fetch of the discovery document
+    return build(
+        api_name,
+        'v3',
+        http=get_authorized_http(),
+        cache_discovery=False,
+        static_discovery=True,
+    )
+
+
 def get_google_api_resource(api_name: str):
     """
-    Create and cache a Google API service resource using service account credentials.
+    Get a Google API service resource, stopping the app with an error if it can't be built.
 
     Parameters
     ----------
@@ -284,18 +646,14 @@ def get_google_api_resource(api_name: str):
         An authorized Google API service resource.
     """
     try:
-        service_account_info = st.secrets['gcp_service_account']
-        credentials = Credentials.from_service_account_info(service_account_info, scopes=SCOPES)
-
-        service = build(api_name, 'v3', credentials=credentials)
-        return service
+        return build_google_api_resource(api_name)
     except Exception as e:
         st.error(f'Failed to authenticate with Google {api_name.capitalize()}:')
         st.exception(e)
         st.stop()
 
 
-@st.cache_data()
+@st.cache_data(max_entries=128)
 def get_drive_file_name(file_url: str) -> str | None:
     """
     Get a the name of a file from Google Drive given its URL.
@@ -322,7 +680,8 @@ def get_drive_file_name(file_url: str) -> str | None:
             return None
 
         # Call the Drive API to get the file metadata
-        file = get_google_api_resource('drive').files().get(fileId=file_id, fields='name').execute()
+        request = get_google_api_resource('drive').files().get(fileId=file_id, fields='name')
+        file = request.execute(num_retries=NUM_RETRIES)
         return file.get('name')
 
     except Exception as e:
@@ -347,8 +706,11 @@ def add_event_to_calendar(event_data: dict) -> bool:
     bool
         Success status.
     """
-    # Construct the event body
+    # Construct the event body. The client-generated ID makes the insert safe to retry, since
+    # a retry of an insert that already went through fails with a conflict instead of
+    # creating a duplicate event
     event: dict = dict(
+        id=uuid.uuid4().hex,
         summary=event_data[FIELDS.EVENT_NAME],
         location=event_data[FIELDS.LOCATION],
         description=format_description(event_data),
@@ -361,11 +723,15 @@ def add_event_to_calendar(event_data: dict) -> bool:
         event['end'] = {'date': event_data[FIELDS.END_DATE].isoformat()}
     else:
         event['start'] = dict(
-            dateTime=f'{event_data[FIELDS.EVENT_DATE].isoformat()}T{event_data[FIELDS.START_TIME].isoformat()}',
+            dateTime=datetime.combine(
+                event_data[FIELDS.EVENT_DATE], event_data[FIELDS.START_TIME]
+            ).isoformat(),
             **tz,
         )
         event['end'] = dict(
-            dateTime=f'{event_data[FIELDS.END_DATE].isoformat()}T{event_data[FIELDS.END_TIME].isoformat()}',
+            dateTime=datetime.combine(
+                event_data[FIELDS.END_DATE], event_data[FIELDS.END_TIME]
+            ).isoformat(),
             **tz,
         )
 
@@ -395,9 +761,12 @@ def add_event_to_calendar(event_data: dict) -> bool:
     try:
         get_google_api_resource('calendar').events().insert(
             calendarId=calendar_id, body=event, supportsAttachments=True
-        ).execute()
+        ).execute(num_retries=NUM_RETRIES)
         return True
     except Exception as e:
+        # The ID is new, so a conflict means a retried request already created the event
+        if isinstance(e, HttpError) and e.resp.status == 409:
+            return True
         st.error(
             'Error adding event to calendar: Please make sure the calendar ID '
             f'({calendar_id}) is correct and that the service account '
@@ -421,12 +790,15 @@ def format_description(event_data: dict) -> str:
     str
         HTML-formatted event description.
     """
-    return (
-        f'<p>{event_data[FIELDS.DESCRIPTION]}</p>'
-        f'<p><strong>Submitter:</strong> {event_data[FIELDS.ORG_NAME]}<br>'
-        f'<strong>Event Type:</strong> {event_data[FIELDS.EVENT_TYPE]}<br>'
-        f'<strong>Fee:</strong> {event_data[FIELDS.FEE]}<br>'
-        f'<strong>Email:</strong> {event_data[FIELDS.EMAIL]}</p>'
+    # Escape the submitted values so they can't inject markup into the description
+    return DESCRIPTION_TEMPLATE.format_map(
+        {
+            'description': html.escape(str(event_data[FIELDS.DESCRIPTION])),
+            'org_name': html.escape(str(event_data[FIELDS.ORG_NAME])),
+            'event_type': html.escape(str(event_data[FIELDS.EVENT_TYPE])),
+            'fee': html.escape(str(event_data[FIELDS.FEE])),
+            'email': html.escape(str(event_data[FIELDS.EMAIL])),
+        }
     )
 
 
@@ -469,21 +841,11 @@ def show_field_editor(field_name: str, event_data: dict):
     """
     value = event_data[field_name]
     if field_name in (FIELDS.START_TIME, FIELDS.END_TIME):
-        if value == '':
-            value = None
-        elif isinstance(value, str):
-            # Convert string to time for st.time_input
-            value = pd.to_datetime(value).time()
         event_data[field_name] = st.time_input(field_name, value=value)
     elif field_name in (FIELDS.EVENT_DATE, FIELDS.END_DATE, FIELDS.END_REPEAT_DATE):
-        # Convert string to date for st.date_input
-        if field_name == FIELDS.END_DATE and value == '':
+        if field_name == FIELDS.END_DATE and value is None:
             # if end date is not set, default to event date
             value = event_data[FIELDS.EVENT_DATE]
-        elif field_name == FIELDS.END_REPEAT_DATE and value in ('', None):
-            value = None  # allow empty end repeat date, set to None
-        else:
-            value = datetime.strptime(str(value), '%m/%d/%Y')
         event_data[field_name] = st.date_input(
             field_name,
             value=value,
@@ -509,33 +871,43 @@ def show_field_editor(field_name: str, event_data: dict):
         event_data[field_name] = st.text_input(field_name, value=value)
 
 
-def show_event_editor(event_data: dict):
+def show_event_editor(event_data: pd.Series):
     """
     Display an editor for all event fields and return the edited event data.
 
     Parameters
     ----------
-    event_data : dict
-        The event data dictionary to edit.
+    event_data : pd.Series
+        The submission row to edit. It is not modified.
 
     Returns
     -------
     dict
         The edited event data.
     """
-    event_data = event_data.copy()
+    event_data = dict(event_data)
     show_field_editor(FIELDS.EVENT_NAME, event_data)
     with st.container(horizontal=True, vertical_alignment='bottom'):
         show_field_editor(FIELDS.LOCATION, event_data)
+
+        # Only rebuild the link URLs when the location changes, not on every rerun
+        location = event_data[FIELDS.LOCATION]
+        if st.session_state.get('location_urls', (None,))[0] != location:
+            st.session_state['location_urls'] = (
+                location,
+                f'https://www.google.com/maps/search/{quote_plus(location)}',
+                location if location.startswith(('http://', 'https://')) else f'https://{location}',
+            )
+        _, maps_url, location_url = st.session_state['location_urls']
+
         st.link_button(
             'Search Google Maps',
-            url=f'https://www.google.com/maps/search/{quote_plus(event_data[FIELDS.LOCATION])}',
+            url=maps_url,
             help='For addresses, search on Google Maps',
         )
-        url = event_data[FIELDS.LOCATION]
         st.link_button(
             'Open URL',
-            url=url if url.startswith('http://') else f'https://{url}',
+            url=location_url,
             help='For URLs, open in a new tab',
         )
     show_field_editor(FIELDS.DESCRIPTION, event_data)
@@ -591,38 +963,40 @@ def validate_event_data(event_data: dict) -> bool:
     errors = []
     warnings = []
 
-    # Check if event date is in the past
-    today = datetime.now().date()
-    if event_data[FIELDS.EVENT_DATE] < today:
-        warnings.append('Event start date is in the past.')
-
     # Check that the event data contains all required fields
+    errored_fields = set()
     for field in REQUIRED_FIELDS:
         if not event_data.get(field):
             errors.append(f"The field '{field}' is required and cannot be empty.")
+            errored_fields.add(field)
+
+    # Check if event date is in the past
+    today = datetime.now().date()
+    if FIELDS.EVENT_DATE not in errored_fields and event_data[FIELDS.EVENT_DATE] < today:
+        warnings.append('Event start date is in the past.')
 
-    # Validate date and time fields
-    if event_data[FIELDS.END_DATE] < event_data[FIELDS.EVENT_DATE]:
-        errors.append('End Date cannot be earlier than Event Date.')
-    elif event_data[FIELDS.END_DATE] > event_data[FIELDS.EVENT_DATE]:
-        if event_data[FIELDS.START_TIME] is not None or event_data[FIELDS.END_TIME] is not None:
-            warnings.append('Start and end times are ignored for multi-day events.')
-    elif event_data[FIELDS.START_TIME] is not None or event_data[FIELDS.END_TIME] is not None:
-        if event_data[FIELDS.START_TIME] is None:
-            errors.append('If End Time is set, Start Time must also be set.')
-        elif event_data[FIELDS.END_TIME] is None:
-            errors.append('If Start Time is set, End Time must also be set.')
-        elif event_data[FIELDS.END_TIME] < event_data[FIELDS.START_TIME]:
-            errors.append('End Time must be after Start Time.')
-    elif (
-        event_data[FIELDS.END_REPEAT_DATE] is not None
-        and event_data[FIELDS.END_REPEAT_DATE] < event_data[FIELDS.EVENT_DATE]
-    ):
-        errors.append('End Repeat After date cannot be earlier than Event Date.')
-
-    # Validate email format
-    email_pattern = r'^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,6}$'
-    if not re.match(email_pattern, event_data[FIELDS.EMAIL]):
+    # Validate date and time fields, skipping the checks if the dates are missing
+    if FIELDS.EVENT_DATE not in errored_fields and event_data[FIELDS.END_DATE] is not None:
+        if event_data[FIELDS.END_DATE] < event_data[FIELDS.EVENT_DATE]:
+            errors.append('End Date cannot be earlier than Event Date.')
+        elif event_data[FIELDS.END_DATE] > event_data[FIELDS.EVENT_DATE]:
+            if event_data[FIELDS.START_TIME] is not None or event_data[FIELDS.END_TIME] is not None:
+                warnings.append('Start and end times are ignored for multi-day events.')
+        elif event_data[FIELDS.START_TIME] is not None or event_data[FIELDS.END_TIME] is not None:
+            if event_data[FIELDS.START_TIME] is None:
+                errors.append('If End Time is set, Start Time must also be set.')
+            elif event_data[FIELDS.END_TIME] is None:
+                errors.append('If Start Time is set, End Time must also be set.')
+            elif event_data[FIELDS.END_TIME] < event_data[FIELDS.START_TIME]:
+                errors.append('End Time must be after Start Time.')
+        elif (
+            event_data[FIELDS.END_REPEAT_DATE] is not None
+            and event_data[FIELDS.END_REPEAT_DATE] < event_data[FIELDS.EVENT_DATE]
+        ):
+            errors.append('End Repeat After date cannot be earlier than Event Date.')
+
+    # Validate email format, unless it is already reported as missing
+    if FIELDS.EMAIL not in errored_fields and not EMAIL_PATTERN.match(event_data[FIELDS.EMAIL]):
         errors.append(
             f"Email '{event_data[FIELDS.EMAIL]}' is not valid. Please enter a valid email address."
         )
@@ -659,13 +1033,81 @@ def show_header(spreadsheet_id: str):
         sheet_url = f'https://docs.google.com/spreadsheets/d/{spreadsheet_id}/edit'
         st.link_button('Form Responses GSheet', url=sheet_url, icon=':material/open_in_new:')
         if st.button('🔄 Refresh Data', help='Re-load the data from the GSheet.'):
-            st.cache_data.clear()
+            clear_sheet_values(spreadsheet_id)
+            load_spreadsheet_data.clear()
+            st.rerun()
+        if st.button('👥 Refresh Users', help='Re-load the authorized users from the GSheet.'):
+            clear_sheet_values(spreadsheet_id)
+            get_authorized_users.clear()
             st.rerun()
         with st.container(horizontal_alignment='right'):
             if st.button('Log out'):
                 st.logout()
 
 
+# Run as a fragment so editing only reruns the editor, not the whole app
+@st.fragment
+def show_submission_editor(spreadsheet_id: str, selected_row: pd.Series):
+    """
+    Display the editor and action buttons for the selected submission.
+
+    Parameters
+    ----------
+    spreadsheet_id : str
+        The ID of the Google Spreadsheet.
+    selected_row : pandas.Series
+        The selected submission, named by its row number in the sheet.
+
+    Returns
+    -------
+    None
+    """
+    st.divider()
+    st.subheader('Edit Submission Details')
+
+    # Edit in a form, so changing a field doesn't rerun anything until a button is clicked
+    with st.form('edit_submission', border=False):
+        # Create editable fields for the selected submission
+        edited_data = show_event_editor(selected_row)
+
+        # Action buttons submit the form, so they always act on the latest edits
+        with st.container(horizontal=True):
+            st.form_submit_button('🔍 Preview', help='Check the edits and update the preview.')
+            ignore_clicked = st.form_submit_button('🚫 Mark as Ignored', type='secondary')
+            add_clicked = st.form_submit_button('📅 Add to Calendar', type='primary')
+
+    if not validate_event_data(edited_data):
+        return
+
+    with st.expander('Formatted Description', expanded=True):
+        st.html(format_description(edited_data))
+
+    # After a status update, rerun the whole app rather than just this fragment, so the
+    # processed submission drops out of the table and the editor. The toast outlives the rerun
+    if ignore_clicked:
+        if update_submission_status(
+            spreadsheet_id, selected_row.name, 'Ignored', st.session_state['user_name']
+        ):
+            st.toast(f"Marked '{edited_data[FIELDS.EVENT_NAME]}' as ignored", icon='🚫')
+            st.rerun(scope='app')
+
+    if add_clicked:
+        # The status is only updated once the insert succeeds, so the two calls can't overlap
+        with st.spinner('Adding event to calendar...'):
+            added = add_event_to_calendar(edited_data)
+        if added:
+            if update_submission_status(
+                spreadsheet_id,
+                selected_row.name,
+                'Added to Calendar',
+                st.session_state['user_name'],
+            ):
+                st.toast(f"Added '{edited_data[FIELDS.EVENT_NAME]}' to calendar!", icon='📅')
+                st.rerun(scope='app')
+        else:
+            st.error('Failed to add event to calendar.')
+
+
 # Main application
 def main():
     """
@@ -682,6 +1124,9 @@ def main():
             st.login()
         st.stop()
 
+    # The logged-in user doesn't change within a session, so look up their name once
+    st.session_state.setdefault('user_name', st.user.name)
+
     # Get spreadsheet ID from secrets
     if (spreadsheet_id := st.secrets.get('spreadsheet_id')) is None:
         st.error('`spreadsheet_id` not found in secrets. Please add it to .streamlit/secrets.toml')
@@ -713,7 +1158,7 @@ def main():
 
     # Display the dataframe with row selection
     dataframe_state = st.dataframe(
-        submissions.rename(columns={'Timestamp': 'Submission Time'}),
+        submissions,
         width='stretch',
         on_select='rerun',
         selection_mode='single-row',
@@ -721,9 +1166,7 @@ def main():
     )
 
     # Check that all expected columns are present
-    missing_columns = [
-        col for col in REQUIRED_FIELDS + OPTIONAL_FIELDS if col not in submissions.columns
-    ]
+    missing_columns = sorted(ALL_FIELDS.difference(submissions.columns))
     if len(missing_columns) > 0:
         st.error(
             f'The following required columns are missing from the spreadsheet: {", ".join(missing_columns)}'
@@ -732,35 +1175,7 @@ def main():
 
     # Handle row selection
     if len((rows := dataframe_state.selection.rows)) > 0:  # type: ignore
-        selected_row = submissions.iloc[rows[0]]
-
-        st.divider()
-        st.subheader('Edit Submission Details')
-
-        # Create editable fields for the selected submission
-        edited_data = show_event_editor(selected_row.to_dict())
-        if not validate_event_data(edited_data):
-            st.stop()
-
-        with st.expander('Formatted Description', expanded=True):
-            st.html(format_description(edited_data))
-
-        # Action buttons
-        with st.container(horizontal=True):
-            if st.button('🚫 Mark as Ignored', type='secondary'):
-                # Find original row index
-                if update_submission_status(spreadsheet_id, selected_row.name, 'Ignored'):
-                    st.success(f"Marked '{edited_data[FIELDS.EVENT_NAME]}' as ignored")
-
-            if st.button('📅 Add to Calendar', type='primary'):
-                if add_event_to_calendar(edited_data):
-                    if update_submission_status(
-                        spreadsheet_id, selected_row.name, 'Added to Calendar'
-                    ):
-                        st.success(f"Added '{edited_data[FIELDS.EVENT_NAME]}' to calendar!")
-                else:
-                    st.error('Failed to add event to calendar.')
-
+        show_submission_editor(spreadsheet_id, submissions.iloc[rows[0]])
     else:
         st.info(
             'Select a row from the table above to review and edit the submission.',
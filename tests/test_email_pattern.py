@@ -0,0 +1,21 @@
+import pytest
+
+from main import EMAIL_PATTERN
+
+
+@pytest.mark.parametrize('email', ['organizer@example.com', 'first.last+events@sub.example.org'])
+def test_email_pattern_accepts_valid_addresses(email):
+    assert EMAIL_PATTERN.match(email)
+
+
+@pytest.mark.parametrize(
+    'email',
+    [
+        'organizer@example.com\n',  # trailing newline is not ignored like with '$'
+        'organizer@example',
+        'organizer.example.com',
+        'orgänizer@example.com',
+    ],
+)
+def test_email_pattern_rejects_invalid_addresses(email):
+    assert not EMAIL_PATTERN.match(email)
@@ -0,0 +1,18 @@
+from main import FIELDS, format_description
+
+
+def test_format_description_escapes_submitted_values():
+    event_data = {
+        FIELDS.DESCRIPTION: 'Bring <snacks> & drinks',
+        FIELDS.ORG_NAME: 'Friends of the Library',
+        FIELDS.EVENT_TYPE: 'Fundraiser',
+        FIELDS.FEE: '$5',
+        FIELDS.EMAIL: 'friends@example.com',
+    }
+    assert format_description(event_data) == (
+        '<p>Bring &lt;snacks&gt; &amp; drinks</p>'
+        '<p><strong>Submitter:</strong> Friends of the Library<br>'
+        '<strong>Event Type:</strong> Fundraiser<br>'
+        '<strong>Fee:</strong> $5<br>'
+        '<strong>Email:</strong> friends@example.com</p>'
+    )
@@ -0,0 +1,60 @@
+from datetime import date, time
+
+import pytest
+
+import main
+from main import FIELDS, load_spreadsheet_data
+
+HEADERS = [
+    FIELDS.TIMESTAMP,
+    FIELDS.EVENT_NAME,
+    'Notes',
+    FIELDS.EVENT_DATE,
+    FIELDS.START_TIME,
+    FIELDS.LOCATION,
+    FIELDS.STATUS,
+    FIELDS.LAST_UPDATED_BY,
+]
+
+ROWS = [
+    HEADERS,
+    ['t2', 'Book Sale', 'note', '7/15/2025', '10:00:00 AM', 'Library'],  # row 2, no status
+    ['t3', 'Old', '', '1/1/2020', '', 'x', 'Ignored', 'Tester'],  # row 3, hidden
+    [],  # row 4, blank
+    ['t5', 'Done', '', '1/1/2020', '', 'x', 'Added to Calendar', 'Tester'],  # row 5, hidden
+    ['t6', 'Bake Sale'],  # row 6, short
+]
+
+
+@pytest.fixture(autouse=True)
+def sheet_values(monkeypatch):
+    monkeypatch.setattr(main, 'get_sheet_values', lambda spreadsheet_id: {'Form Responses 1': ROWS})
+    load_spreadsheet_data.clear()
+    yield
+    load_spreadsheet_data.clear()
+
+
+def test_index_is_sheet_row_number_of_pending_rows():
+    df = load_spreadsheet_data('sid')
+    assert df.index.tolist() == [2, 4, 6]
+    assert df[FIELDS.EVENT_NAME].tolist() == ['Book Sale', '', 'Bake Sale']
+
+
+def test_keeps_only_loaded_columns_and_renames_for_display():
+    df = load_spreadsheet_data('sid')
+    assert df.columns.tolist() == [
+        'Submission Time',
+        FIELDS.EVENT_NAME,
+        FIELDS.EVENT_DATE,
+        FIELDS.START_TIME,
+        FIELDS.LOCATION,
+    ]
+
+
+def test_fills_missing_trailing_cells():
+    df = load_spreadsheet_data('sid')
+    assert df.loc[2, FIELDS.EVENT_DATE] == date(2025, 7, 15)
+    assert df.loc[2, FIELDS.START_TIME] == time(10)
+    assert df.loc[6, FIELDS.LOCATION] == ''
+    assert df.loc[6, FIELDS.EVENT_DATE] is None
+    assert df.loc[6, FIELDS.START_TIME] is None
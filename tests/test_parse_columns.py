@@ -0,0 +1,15 @@
+from datetime import date, time
+
+import pandas as pd
+
+from main import parse_date_column, parse_time_column
+
+
+def test_parse_date_column_handles_empty_and_invalid_values():
+    values = pd.Series(['7/15/2025', '12/01/2025', '', 'not a date'])
+    assert parse_date_column(values).tolist() == [date(2025, 7, 15), date(2025, 12, 1), None, None]
+
+
+def test_parse_time_column_falls_back_to_format_inference():
+    values = pd.Series(['10:00:00 AM', '1:30:00 PM', '18:45', '', 'not a time'])
+    assert parse_time_column(values).tolist() == [time(10), time(13, 30), time(18, 45), None, None]
@@ -0,0 +1,63 @@
+from unittest import mock
+
+import gspread
+import pytest
+
+import main
+from main import NUM_RETRIES, RetryingHTTPClient
+
+
+def make_response(status_code):
+    response = mock.Mock(status_code=status_code, ok=status_code < 400)
+    response.json.return_value = {'error': {'code': status_code, 'message': 'error'}}
+    return response
+
+
+def make_html_response(status_code):
+    response = mock.Mock(status_code=status_code, ok=status_code < 400, text='<html></html>')
+    response.json.side_effect = ValueError('not JSON')
+    return response
+
+
+@pytest.fixture
+def session():
+    return mock.Mock()
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    monkeypatch.setattr(main.time, 'sleep', lambda seconds: None)
+
+
+def test_retries_rate_limited_requests(session):
+    session.request.side_effect = [make_response(429), make_response(503), make_response(200)]
+    client = RetryingHTTPClient(auth=None, session=session)
+    assert client.request('get', 'https://example.com').status_code == 200
+    assert session.request.call_count == 3
+
+
+def test_retries_gateway_errors_without_json_body(session):
+    session.request.side_effect = [
+        make_html_response(502),
+        make_html_response(504),
+        make_response(200),
+    ]
+    client = RetryingHTTPClient(auth=None, session=session)
+    assert client.request('get', 'https://example.com').status_code == 200
+    assert session.request.call_count == 3
+
+
+def test_gives_up_after_max_retries(session):
+    session.request.return_value = make_response(429)
+    client = RetryingHTTPClient(auth=None, session=session)
+    with pytest.raises(gspread.exceptions.APIError):
+        client.request('get', 'https://example.com')
+    assert session.request.call_count == NUM_RETRIES + 1
+
+
+def test_does_not_retry_client_errors(session):
+    session.request.return_value = make_response(400)
+    client = RetryingHTTPClient(auth=None, session=session)
+    with pytest.raises(gspread.exceptions.APIError):
+        client.request('get', 'https://example.com')
+    assert session.request.call_count == 1
@@ -0,0 +1,55 @@
+from datetime import date, time
+
+import pytest
+
+import main
+from main import FIELDS, validate_event_data
+
+
+@pytest.fixture
+def messages(monkeypatch):
+    """Collect the errors and warnings shown by validate_event_data."""
+    collected = {'error': [], 'warning': []}
+    monkeypatch.setattr(main.st, 'error', collected['error'].append)
+    monkeypatch.setattr(main.st, 'warning', collected['warning'].append)
+    return collected
+
+
+@pytest.fixture
+def event_data():
+    return {
+        FIELDS.EVENT_NAME: 'Book Sale',
+        FIELDS.LOCATION: 'Public Library',
+        FIELDS.DESCRIPTION: 'Used books for sale.',
+        FIELDS.ORG_NAME: 'Friends of the Library',
+        FIELDS.EVENT_TYPE: 'Fundraiser',
+        FIELDS.FEE: 'Free',
+        FIELDS.EVENT_DATE: date(2099, 5, 2),
+        FIELDS.END_DATE: date(2099, 5, 2),
+        FIELDS.START_TIME: time(9),
+        FIELDS.END_TIME: time(12),
+        FIELDS.EMAIL: 'friends@example.com',
+        FIELDS.FREQUENCY: 'One-time',
+        FIELDS.END_REPEAT_DATE: None,
+    }
+
+
+def test_validate_event_data_accepts_valid_event(event_data, messages):
+    assert validate_event_data(event_data)
+    assert messages == {'error': [], 'warning': []}
+
+
+def test_validate_event_data_skips_email_format_check_for_missing_email(event_data, messages):
+    event_data[FIELDS.EMAIL] = ''
+    assert not validate_event_data(event_data)
+    assert messages['error'] == [f"The field '{FIELDS.EMAIL}' is required and cannot be empty."]
+
+
+def test_validate_event_data_skips_date_checks_for_missing_event_date(event_data, messages):
+    event_data[FIELDS.EVENT_DATE] = None
+    event_data[FIELDS.END_DATE] = None
+    assert not validate_event_data(event_data)
+    assert messages['error'] == [
+        f"The field '{FIELDS.EVENT_DATE}' is required and cannot be empty."
+    ]
+    assert messages['warning'] == []